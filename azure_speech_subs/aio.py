@@ -0,0 +1,130 @@
+import asyncio
+import os
+import tempfile
+import uuid
+
+import aiohttp
+
+from .synthesizer import (
+    MAX_POLL_DELAY,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    _build_payload,
+    _extract_results,
+    _poll_wait,
+)
+
+
+class AsyncSpeechSynthesizer:
+    def __init__(self, azure_speech_key, azure_speech_region):
+        self.azure_speech_key = azure_speech_key
+        self.azure_speech_region = azure_speech_region
+        self.base_url = f"https://{azure_speech_region}.api.cognitive.microsoft.com"
+        self._session = None
+
+    def _get_session(self):
+        # The session has to be created inside a running event loop, so do it lazily
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Ocp-Apim-Subscription-Key": self.azure_speech_key},
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(self, method, url, **kwargs):
+        """Send a request, retrying throttled or failed ones like the sync client's HTTPAdapter"""
+        session = self._get_session()
+        for attempt in range(RETRY_TOTAL + 1):
+            backoff = RETRY_BACKOFF_FACTOR * 2 ** attempt
+            try:
+                response = await session.request(method, url, **kwargs)
+            except aiohttp.ClientConnectionError:
+                if attempt == RETRY_TOTAL:
+                    raise
+                await asyncio.sleep(backoff)
+                continue
+
+            if response.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return response
+            wait = _poll_wait(response.headers, backoff)
+            response.release()
+            await asyncio.sleep(wait)
+
+    async def _delete_job(self, synthesis_url):
+        # A single best-effort attempt: cleanup failure shouldn't break the main flow
+        try:
+            async with self._get_session().delete(synthesis_url):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+    async def synthesize_speech(self, text, voice, output_directory):
+        """
+        Synthesize speech using Azure Batch Synthesis API without blocking the event loop
+
+        Args:
+            text (str): Text to synthesize
+            voice (str): Voice name (e.g., 'en-US-JennyNeural')
+            output_directory (str): Directory to save output files
+
+        Returns:
+            dict: Contains paths to generated audio and boundary files
+        """
+        # Create unique synthesis ID
+        synthesis_id = str(uuid.uuid4())
+
+        # Ensure output directory exists
+        await asyncio.to_thread(os.makedirs, output_directory, exist_ok=True)
+
+        # Submit batch synthesis request
+        synthesis_url = f"{self.base_url}/texttospeech/batchsyntheses/{synthesis_id}?api-version=2024-04-01"
+        try:
+            async with await self._request("PUT", synthesis_url, json=_build_payload([text], voice)) as response:
+                response.raise_for_status()
+
+            # Poll for completion with exponential backoff
+            delay = 0.5
+            while True:
+                async with await self._request("GET", synthesis_url) as status_response:
+                    status_response.raise_for_status()
+                    status_data = await status_response.json()
+                    wait = _poll_wait(status_response.headers, delay)
+
+                if status_data["status"] == "Succeeded":
+                    break
+                elif status_data["status"] == "Failed":
+                    raise Exception(f"Synthesis failed: {status_data}")
+
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, MAX_POLL_DELAY)
+
+            # Download results into an anonymous temp file and extract only the wanted entries,
+            # doing the file I/O in worker threads so the event loop keeps running
+            results_url = status_data["outputs"]["result"]
+            zip_file = await asyncio.to_thread(tempfile.TemporaryFile)
+            try:
+                async with await self._request("GET", results_url) as results_response:
+                    results_response.raise_for_status()
+                    async for chunk in results_response.content.iter_chunked(1024 * 1024):
+                        await asyncio.to_thread(zip_file.write, chunk)
+                await asyncio.to_thread(zip_file.seek, 0)
+                extracted_files = await asyncio.to_thread(_extract_results, zip_file, output_directory)
+            finally:
+                await asyncio.to_thread(zip_file.close)
+        finally:
+            # Clean up the batch synthesis job, whether or not it succeeded
+            await self._delete_job(synthesis_url)
+
+        return extracted_files
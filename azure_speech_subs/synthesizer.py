@@ -1,20 +1,92 @@
+import concurrent.futures
+import hashlib
+import json
 import os
-import requests
+import re
+import shutil
+import threading
 import time
 import uuid
+import wave
 import zipfile
-import json
-import srt
-from datetime import timedelta
-import shutil
+
+import requests
+from requests.adapters import HTTPAdapter
+from stream_unzip import stream_unzip
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Retry policy for throttled or failed requests, shared by the sync and async clients
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Longest wait between status polls, in seconds
+MAX_POLL_DELAY = 30
+
+# Texts longer than this many characters are split into several batch inputs
+CHUNK_THRESHOLD = 2000
+
+# Default HTTP connection pool size, and the number of threads deleting finished jobs
+POOL_MAXSIZE = 16
+CLEANUP_WORKERS = 2
+
+# Files generate_speech_with_subtitles writes, and the raw names they are extracted under
+OUTPUT_FILENAMES = frozenset(['audio.wav', 'words.json', 'transcript.srt', 'transcript.srt.tmp'])
+RAW_RESULT_FILENAME = re.compile(r"^(\d+|merged)\.(wav|word\.json)$", re.IGNORECASE)
+
+# Runs of blank lines, which aren't allowed inside an SRT subtitle
+BLANK_LINES = re.compile(r"\n\n+")
 
 class SpeechSynthesizer:
-    def __init__(self, azure_speech_key, azure_speech_region):
+    def __init__(self, azure_speech_key, azure_speech_region, cache_dir=None):
         self.azure_speech_key = azure_speech_key
         self.azure_speech_region = azure_speech_region
         self.base_url = f"https://{azure_speech_region}.api.cognitive.microsoft.com"
+        # Optional directory of previously synthesized audio and word boundaries, keyed by (text, voice)
+        self.cache_dir = cache_dir
 
-    def synthesize_speech(self, text, voice, output_directory):
+        # Reuse one keep-alive connection pool for the submit, poll, download and delete calls
+        self._session = requests.Session()
+        self._session.headers.update({"Ocp-Apim-Subscription-Key": azure_speech_key})
+        self._pool_maxsize = 0
+        self._ensure_pool_size(POOL_MAXSIZE)
+
+        # Deletes finished batch jobs off the critical path; created on first use and again after close()
+        self._cleanup_executor = None
+        self._cleanup_lock = threading.Lock()
+
+    def _ensure_pool_size(self, pool_maxsize):
+        # Mount a bigger adapter when more threads may share the session than the pool holds
+        if pool_maxsize <= self._pool_maxsize:
+            return
+        retry = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES)
+        old_adapter = self._session.adapters.get("https://")
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry))
+        self._pool_maxsize = pool_maxsize
+        # Release the old pool's keep-alive sockets; requests already using it finish normally
+        if old_adapter is not None:
+            old_adapter.close()
+
+    def close(self):
+        """Wait for pending job cleanup and close the underlying HTTP session"""
+        with self._cleanup_lock:
+            executor, self._cleanup_executor = self._cleanup_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def synthesize_speech(self, text, voice, output_directory, split_characters=None):
         """
         Synthesize speech using Azure Batch Synthesis API
         
@@ -22,50 +94,113 @@ class SpeechSynthesizer:
             text (str): Text to synthesize
             voice (str): Voice name (e.g., 'en-US-JennyNeural')
             output_directory (str): Directory to save output files
+            split_characters (str, optional): Characters long texts may be split on.
+                Each chunk is submitted as a separate input and the results are
+                stitched back into one audio and one word boundary file.
             
         Returns:
             dict: Contains paths to generated audio and boundary files
         """
-        # Create unique synthesis ID
-        synthesis_id = str(uuid.uuid4())
-        
         # Ensure output directory exists
         os.makedirs(output_directory, exist_ok=True)
+
+        synthesis_url = self._submit_synthesis(text, voice, split_characters)
+        return self._poll_and_download(synthesis_url, output_directory)
+
+    def synthesize_many(self, items, output_directory, max_workers=8):
+        """
+        Synthesize several texts concurrently using Azure Batch Synthesis API
+
+        All jobs are submitted up front, then polled and downloaded in parallel
+        over the shared HTTP session.
+
+        Args:
+            items (list): (text, voice) pairs to synthesize
+            output_directory (str): Directory to save output files; each item
+                gets its own numbered subdirectory
+            max_workers (int): Maximum number of jobs to poll at once
+
+        Returns:
+            list: One dict of audio and boundary file paths per item, in input order
+        """
+        item_directories = [os.path.join(output_directory, f"{i:04d}") for i in range(len(items))]
+        for item_directory in item_directories:
+            os.makedirs(item_directory, exist_ok=True)
+
+        # Every poll thread plus the cleanup threads may hold a connection at once
+        self._ensure_pool_size(max_workers + CLEANUP_WORKERS)
+
+        # Submit every job first so Azure can work on them in parallel
+        synthesis_urls = []
+        try:
+            for text, voice in items:
+                synthesis_urls.append(self._submit_synthesis(text, voice))
+        except Exception:
+            # Don't leave the jobs that were already submitted behind on Azure
+            for synthesis_url in synthesis_urls:
+                self._delete_job(synthesis_url)
+            raise
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._poll_and_download, synthesis_url, item_directory)
+                for synthesis_url, item_directory in zip(synthesis_urls, item_directories)
+            ]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                # Jobs that already started clean up after themselves; delete the ones never polled
+                for synthesis_url, future in zip(synthesis_urls, futures):
+                    if future.cancel():
+                        self._delete_job(synthesis_url)
+                raise
+
+    def _submit_synthesis(self, text, voice, split_characters=None):
+        # Create unique synthesis ID
+        synthesis_id = str(uuid.uuid4())
         
         # Submit batch synthesis request
         synthesis_url = f"{self.base_url}/texttospeech/batchsyntheses/{synthesis_id}?api-version=2024-04-01"
         
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.azure_speech_key,
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "inputKind": "PlainText",
-            "synthesisConfig": {
-                "voice": voice
-            },
-            "inputs": [
-                {
-                    "content": text
-                }
-            ],
-            "properties": {
-                "outputFormat": "riff-24khz-16bit-mono-pcm",
-                "wordBoundaryEnabled": True,
-                "sentenceBoundaryEnabled": False,
-                "concatenateResult": False,
-                "decompressOutputFiles": False
-            }
-        }
+        if split_characters and len(text) > CHUNK_THRESHOLD:
+            chunks = _split_text(text, split_characters, CHUNK_THRESHOLD)
+        else:
+            chunks = [text]
+        payload = _build_payload(chunks, voice)
         
         # Submit the request
-        response = requests.put(synthesis_url, headers=headers, json=payload)
+        response = self._session.put(synthesis_url, json=payload)
         response.raise_for_status()
-        
-        # Poll for completion
+
+        return synthesis_url
+
+    def _delete_job(self, synthesis_url):
+        # Note: We don't check the result here as cleanup failure shouldn't break the main flow
+        try:
+            with self._cleanup_lock:
+                if self._cleanup_executor is None:
+                    self._cleanup_executor = concurrent.futures.ThreadPoolExecutor(max_workers=CLEANUP_WORKERS)
+                self._cleanup_executor.submit(self._session.delete, synthesis_url)
+        except RuntimeError:
+            # The executor can't take new work during interpreter shutdown, so delete inline instead
+            try:
+                self._session.delete(synthesis_url)
+            except requests.RequestException:
+                pass
+
+    def _poll_and_download(self, synthesis_url, output_directory):
+        try:
+            extracted_files = self._wait_and_download(synthesis_url, output_directory)
+        finally:
+            # Clean up the batch synthesis job in the background, whether or not it succeeded
+            self._delete_job(synthesis_url)
+        return extracted_files
+
+    def _wait_and_download(self, synthesis_url, output_directory):
+        # Poll for completion with exponential backoff
+        delay = 0.5
         while True:
-            status_response = requests.get(synthesis_url, headers=headers)
+            status_response = self._session.get(synthesis_url)
             status_response.raise_for_status()
             status_data = status_response.json()
             
@@ -74,37 +209,15 @@ class SpeechSynthesizer:
             elif status_data["status"] == "Failed":
                 raise Exception(f"Synthesis failed: {status_data}")
             
-            # Wait before polling again
-            time.sleep(5)
+            # Wait before polling again, honoring Retry-After if the service sends one
+            time.sleep(_poll_wait(status_response.headers, delay))
+            delay = min(delay * 2, MAX_POLL_DELAY)
         
-        # Download results
+        # Download results, extracting the wanted entries as the ZIP file streams in
         results_url = status_data["outputs"]["result"]
-        results_response = requests.get(results_url, headers={"Ocp-Apim-Subscription-Key": self.azure_speech_key})
-        results_response.raise_for_status()
-        
-        # Save and extract ZIP file
-        zip_path = os.path.join(output_directory, f"{synthesis_id}_results.zip")
-        with open(zip_path, "wb") as f:
-            f.write(results_response.content)
-        
-        # Extract files
-        extracted_files = {}
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for filename in zip_ref.namelist():
-                if filename.endswith('.wav'):
-                    zip_ref.extract(filename, output_directory)
-                    extracted_files['audio'] = os.path.join(output_directory, filename)
-                elif filename.endswith('.word.json'):
-                    zip_ref.extract(filename, output_directory)
-                    extracted_files['word_boundaries'] = os.path.join(output_directory, filename)
-                # Skip summary.json and other unnecessary files
-        
-        # Clean up ZIP file
-        os.remove(zip_path)
-        
-        # Clean up the batch synthesis job
-        delete_response = requests.delete(synthesis_url, headers=headers)
-        # Note: We don't raise_for_status() here as cleanup failure shouldn't break the main flow
+        with self._session.get(results_url, stream=True) as results_response:
+            results_response.raise_for_status()
+            extracted_files = _stream_extract_results(results_response.iter_content(chunk_size=65536), output_directory)
         
         return extracted_files
 
@@ -112,25 +225,28 @@ class SpeechSynthesizer:
         groups = []        
         start_time = None
 
-        current_sub = ""
+        current_parts = []
         last_offset = None
         last_duration = None
+
+        split_set = frozenset(split_characters)
+
+        # Detect the key casing once from the first token
+        first = word_boundaries[0] if word_boundaries else {}
+        text_key = "Text" if "Text" in first else "text"
+        offset_key = "AudioOffset" if "AudioOffset" in first else "audiooffset"
+        duration_key = "Duration" if "Duration" in first else "duration"
         
         for token in word_boundaries:
-            text = token.get("Text") or token.get("text")
+            text = token.get(text_key)
             # Fix: Handle the case where Duration might be 0
-            offset = token.get("AudioOffset")
-            if offset is None:
-                offset = token.get("audiooffset")
-                
-            duration = token.get("Duration")
-            if duration is None:
-                duration = token.get("duration")
+            offset = token.get(offset_key)
+            duration = token.get(duration_key)
 
             if start_time is None:
                 start_time = offset
 
-            current_sub += text
+            current_parts.append(text)
             
             # Keep track of the last valid offset and duration
             if offset is not None:
@@ -138,19 +254,20 @@ class SpeechSynthesizer:
             if duration is not None:
                 last_duration = duration
 
-            if text and text[-1] in split_characters:
+            if text and text[-1] in split_set:
                 group = {
-                    "text": current_sub.strip(),
+                    "text": "".join(current_parts).strip(),
                     "start": start_time,
                     "end": offset + duration
                 }
                 groups.append(group)
 
-                current_sub = ""
+                current_parts = []
                 start_time = None
 
         # Handle any remaining text that doesn't end with split characters
-        if current_sub.strip() and start_time is not None:
+        remaining = "".join(current_parts).strip()
+        if remaining and start_time is not None:
             # Use the last valid offset and duration if available
             if last_offset is not None and last_duration is not None:
                 end_time = last_offset + last_duration
@@ -158,7 +275,7 @@ class SpeechSynthesizer:
                 end_time = start_time + 1000
                 
             group = {
-                "text": current_sub.strip(),
+                "text": remaining,
                 "start": start_time,
                 "end": end_time
             }
@@ -167,19 +284,50 @@ class SpeechSynthesizer:
         return groups
             
     def save_subs(self, groups, srt_filepath):
-        subs = []
-        for i, group in enumerate(groups):
-            start = timedelta(milliseconds=group["start"])
-            end = timedelta(milliseconds=group["end"])
-            content = group["text"]
+        # Write to a temporary file first so a crash never leaves a truncated transcript behind
+        tmp_filepath = srt_filepath + ".tmp"
+        with open(tmp_filepath, "w", encoding="utf-8") as f:
+            index = 0
+            for group in groups:
+                # Skip subtitles a player can't show, as srt.compose did: empty text or no duration
+                if not group['text'].strip() or group['start'] < 0 or group['start'] >= group['end']:
+                    continue
+                index += 1
+                # Blank lines would end the SRT block early, so collapse them
+                text = BLANK_LINES.sub("\n", group['text'].strip("\n"))
+                f.write(f"{index}\n{_format_timestamp(group['start'])} --> {_format_timestamp(group['end'])}\n{text}\n\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, srt_filepath)
 
-            sub = srt.Subtitle(index=i+1, start=start, end=end, content=content)
-            subs.append(sub)
+    def _cache_path(self, text, voice):
+        if self.cache_dir is None:
+            return None
+        key = hashlib.blake2b(voice.encode("utf-8") + b"\0" + text.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, key)
 
-        srt_content = srt.compose(subs)
+    def _is_cached(self, cache_path):
+        return (os.path.exists(os.path.join(cache_path, "audio.wav"))
+                and os.path.exists(os.path.join(cache_path, "words.json")))
 
-        with open(srt_filepath, "w", encoding="utf-8") as f:
-            f.write(srt_content)
+    def _store_in_cache(self, cache_path, audio_path, words_path):
+        # The cache is only an optimisation, so failing to write it must not fail the pipeline
+        tmp_path = None
+        try:
+            os.makedirs(cache_path, exist_ok=True)
+            # Copy to temporary names first so a partial copy is never seen as a cache hit
+            for source, filename in [(audio_path, "audio.wav"), (words_path, "words.json")]:
+                destination = os.path.join(cache_path, filename)
+                tmp_path = destination + ".tmp"
+                shutil.copyfile(source, tmp_path)
+                os.replace(tmp_path, destination)
+                tmp_path = None
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     def generate_speech_with_subtitles(self, text, voice, output_directory, split_characters):
         """
@@ -195,29 +343,38 @@ class SpeechSynthesizer:
             dict: Contains paths to audio.wav, words.json, and transcript.srt
         """
         try:
-            # Step 1: Synthesize speech and get raw files
-            raw_files = self.synthesize_speech(text, voice, output_directory)
-            
-            # Step 2: Load word boundaries
-            with open(raw_files['word_boundaries'], 'r', encoding='utf-8') as f:
-                word_boundaries = json.load(f)
-            
-            # Step 3: Build subtitle groups
-            groups = self.build_groups(word_boundaries, split_characters)
-            
-            # Step 4: Define final output paths
+            # Step 1: Define final output paths
             final_audio_path = os.path.join(output_directory, "audio.wav")
             final_words_path = os.path.join(output_directory, "words.json")
             final_srt_path = os.path.join(output_directory, "transcript.srt")
+
+            cache_path = self._cache_path(text, voice)
+            if cache_path is not None and self._is_cached(cache_path):
+                # Step 2: Reuse previously synthesized files
+                os.makedirs(output_directory, exist_ok=True)
+                shutil.copyfile(os.path.join(cache_path, "audio.wav"), final_audio_path)
+                shutil.copyfile(os.path.join(cache_path, "words.json"), final_words_path)
+                word_boundaries = _load_json(final_words_path)
+            else:
+                # Step 2: Synthesize speech and get raw files
+                raw_files = self.synthesize_speech(text, voice, output_directory, split_characters)
+
+                # Step 3: Load word boundaries
+                word_boundaries = _load_json(raw_files['word_boundaries'])
+
+                # Step 4: Rename audio file
+                if 'audio' in raw_files:
+                    os.replace(raw_files['audio'], final_audio_path)
+
+                # Step 5: Rename word boundaries file
+                if 'word_boundaries' in raw_files:
+                    os.replace(raw_files['word_boundaries'], final_words_path)
+
+                if cache_path is not None:
+                    self._store_in_cache(cache_path, final_audio_path, final_words_path)
             
-            # Step 5: Rename audio file
-            if 'audio' in raw_files:
-                shutil.move(raw_files['audio'], final_audio_path)
-            
-            # Step 6: Copy and rename word boundaries file
-            if 'word_boundaries' in raw_files:
-                shutil.copy2(raw_files['word_boundaries'], final_words_path)
-                os.remove(raw_files['word_boundaries'])
+            # Step 6: Build subtitle groups
+            groups = self.build_groups(word_boundaries, split_characters)
             
             # Step 7: Generate and save SRT file
             self.save_subs(groups, final_srt_path)
@@ -231,10 +388,199 @@ class SpeechSynthesizer:
             }
             
         except Exception as e:
-            # Clean up any partial files on error
-            for filename in ['audio.wav', 'words.json', 'transcript.srt']:
-                filepath = os.path.join(output_directory, filename)
-                if os.path.exists(filepath):
-                    os.remove(filepath)
+            # Clean up any partial or raw files on error
+            self._remove_partial_outputs(output_directory)
             raise e
 
+    def _remove_partial_outputs(self, output_directory):
+        try:
+            with os.scandir(output_directory) as entries:
+                for entry in entries:
+                    if entry.name in OUTPUT_FILENAMES or RAW_RESULT_FILENAME.match(entry.name):
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            # Cleanup must never mask the original error
+            pass
+
+
+def _load_json(filepath):
+    """Load a JSON file with orjson when available, falling back to the stdlib json module"""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _build_payload(chunks, voice):
+    """Build the batch synthesis request body with one input per text chunk"""
+    return {
+        "inputKind": "PlainText",
+        "synthesisConfig": {
+            "voice": voice
+        },
+        "inputs": [
+            {
+                "content": chunk
+            }
+            for chunk in chunks
+        ],
+        "properties": {
+            "outputFormat": "riff-24khz-16bit-mono-pcm",
+            "wordBoundaryEnabled": True,
+            "sentenceBoundaryEnabled": False,
+            "concatenateResult": False,
+            "decompressOutputFiles": False
+        }
+    }
+
+
+def _poll_wait(headers, delay):
+    """Seconds to wait before the next status poll, preferring a Retry-After header"""
+    retry_after = headers.get("Retry-After")
+    if retry_after is None:
+        return delay
+    try:
+        # Keep a bogus negative or huge header within the same bounds as the backoff
+        return max(0.0, min(float(retry_after), MAX_POLL_DELAY))
+    except ValueError:
+        return delay
+
+
+def _format_timestamp(milliseconds):
+    """Format a millisecond offset as an SRT HH:MM:SS,mmm timestamp"""
+    hours, remainder = divmod(int(milliseconds), 3600000)
+    minutes, remainder = divmod(remainder, 60000)
+    seconds, milliseconds = divmod(remainder, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def _split_text(text, split_characters, max_length):
+    """Split text after split characters into chunks of roughly max_length characters"""
+    split_set = frozenset(split_characters)
+    chunks = []
+    start = 0
+    last_split = None
+    for i, character in enumerate(text):
+        if character in split_set:
+            last_split = i + 1
+        if i + 1 - start >= max_length and last_split is not None and last_split > start:
+            chunks.append(text[start:last_split])
+            start = last_split
+    chunks.append(text[start:])
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _classify(filename):
+    """Return the result key a ZIP entry belongs to, or None for files we don't need"""
+    filename = filename.lower()
+    if filename.endswith('.wav'):
+        return 'audio'
+    if filename.endswith('.word.json'):
+        return 'word_boundaries'
+    return None
+
+
+def _extract_results(zip_file, output_directory):
+    """Extract the audio and word boundary files from a results ZIP file"""
+    audio_paths = []
+    word_boundary_paths = []
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            kind = _classify(info.filename)
+            if kind is None:
+                # Skip summary.json and other unnecessary files
+                continue
+            paths = audio_paths if kind == 'audio' else word_boundary_paths
+
+            # Copy with a large buffer rather than extract()'s default one
+            path = os.path.join(output_directory, os.path.basename(info.filename))
+            with zip_ref.open(info) as source, open(path, 'wb') as f:
+                shutil.copyfileobj(source, f, length=1024 * 1024)
+            paths.append(path)
+
+    return _combine_results(audio_paths, word_boundary_paths, output_directory)
+
+
+def _stream_extract_results(zip_chunks, output_directory):
+    """Extract the audio and word boundary files from a ZIP file while it is downloaded"""
+    audio_paths = []
+    word_boundary_paths = []
+    for filename, _size, file_chunks in stream_unzip(zip_chunks):
+        filename = os.path.basename(filename.decode('utf-8'))
+        kind = _classify(filename)
+        if kind is None:
+            # Skip summary.json and other unnecessary files, but the stream still has to be read
+            for _ in file_chunks:
+                pass
+            continue
+        paths = audio_paths if kind == 'audio' else word_boundary_paths
+
+        path = os.path.join(output_directory, filename)
+        with open(path, 'wb') as f:
+            for chunk in file_chunks:
+                f.write(chunk)
+        paths.append(path)
+
+    return _combine_results(audio_paths, word_boundary_paths, output_directory)
+
+
+def _combine_results(audio_paths, word_boundary_paths, output_directory):
+    """Map extracted file paths to the audio and word_boundaries result keys"""
+    # Chunked inputs produce one numbered file pair per chunk
+    if len(audio_paths) > 1:
+        return _merge_chunks(sorted(audio_paths), sorted(word_boundary_paths), output_directory)
+
+    extracted_files = {}
+    if audio_paths:
+        extracted_files['audio'] = audio_paths[0]
+    if word_boundary_paths:
+        extracted_files['word_boundaries'] = word_boundary_paths[0]
+    return extracted_files
+
+
+def _merge_chunks(audio_paths, word_boundary_paths, output_directory):
+    """Concatenate per-chunk WAV files and shift each chunk's word offsets to match"""
+    if len(audio_paths) != len(word_boundary_paths):
+        raise ValueError(
+            f"Expected one word boundary file per audio chunk, got {len(audio_paths)} audio "
+            f"and {len(word_boundary_paths)} word boundary files"
+        )
+
+    merged_audio_path = os.path.join(output_directory, "merged.wav")
+    merged_words_path = os.path.join(output_directory, "merged.word.json")
+
+    merged_words = []
+    total_frames = 0
+    with wave.open(merged_audio_path, 'wb') as merged_audio:
+        for i, (audio_path, words_path) in enumerate(zip(audio_paths, word_boundary_paths)):
+            with wave.open(audio_path, 'rb') as chunk_audio:
+                if i == 0:
+                    merged_audio.setparams(chunk_audio.getparams())
+                chunk_offset = round(total_frames * 1000 / chunk_audio.getframerate())
+                while True:
+                    frames = chunk_audio.readframes(65536)
+                    if not frames:
+                        break
+                    merged_audio.writeframes(frames)
+                total_frames += chunk_audio.getnframes()
+
+            for token in _load_json(words_path):
+                for key in ("AudioOffset", "audiooffset"):
+                    if token.get(key) is not None:
+                        token[key] += chunk_offset
+                merged_words.append(token)
+
+    with open(merged_words_path, 'w', encoding='utf-8') as f:
+        json.dump(merged_words, f, ensure_ascii=False)
+
+    for path in audio_paths + word_boundary_paths:
+        os.remove(path)
+
+    return {
+        'audio': merged_audio_path,
+        'word_boundaries': merged_words_path
+    }
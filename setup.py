@@ -1,16 +1,22 @@
+import pathlib
+
 from setuptools import setup, find_packages
 
 setup(
     name="azure-speech-subs",
     packages=find_packages(), 
     install_requires=[
-        "srt",
         "requests",
-        "python-dotenv"
+        "python-dotenv",
+        "orjson",
+        "stream-unzip"
     ],
+    extras_require={
+        "async": ["aiohttp"]
+    },
     author="Teddy Gonyea",
     description="A tool to generate speech with synchronized subtitles using Azure Cognitive Services.",
-    long_description=open("README.md").read(),
+    long_description=pathlib.Path(__file__).parent.joinpath("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://github.com/tebby24/AzureSpeechSubs",
 )
\ No newline at end of file
@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import wave
+import zipfile
+
+from azure_speech_subs.synthesizer import _extract_results, _split_text
+
+
+def make_wav(milliseconds, framerate=24000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(framerate)
+        w.writeframes(b"\0\0" * (framerate * milliseconds // 1000))
+    return buffer.getvalue()
+
+
+def make_results_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        for name, data in entries.items():
+            zip_ref.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+class SplitTextTest(unittest.TestCase):
+    def test_long_text_is_split_after_split_characters(self):
+        text = "你好世界。" * 600
+        chunks = _split_text(text, ["。"], 2000)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual("".join(chunks), text)
+        for chunk in chunks:
+            self.assertTrue(chunk.endswith("。"))
+
+    def test_whitespace_only_tail_is_dropped(self):
+        self.assertEqual(_split_text("a。b。  ", ["。"], 2), ["a。", "b。"])
+
+
+class MergeChunksTest(unittest.TestCase):
+    def test_chunks_are_concatenated_and_offsets_shifted(self):
+        zip_file = make_results_zip({
+            "0001.wav": make_wav(1000),
+            "0002.wav": make_wav(500),
+            "0001.word.json": json.dumps([{"Text": "你好。", "AudioOffset": 100, "Duration": 400}]),
+            "0002.word.json": json.dumps([{"Text": "再见。", "AudioOffset": 50, "Duration": 300}]),
+            "summary.json": "{}",
+        })
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            result = _extract_results(zip_file, output_directory)
+
+            self.assertEqual(sorted(os.listdir(output_directory)), ["merged.wav", "merged.word.json"])
+            with wave.open(result["audio"], "rb") as w:
+                self.assertEqual(w.getnframes(), 36000)
+            with open(result["word_boundaries"], encoding="utf-8") as f:
+                offsets = [token["AudioOffset"] for token in json.load(f)]
+            self.assertEqual(offsets, [100, 1050])
+
+    def test_mismatched_chunk_counts_raise(self):
+        zip_file = make_results_zip({
+            "0001.wav": make_wav(100),
+            "0002.wav": make_wav(100),
+            "0001.word.json": "[]",
+        })
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            with self.assertRaises(ValueError):
+                _extract_results(zip_file, output_directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from azure_speech_subs.synthesizer import SpeechSynthesizer
+
+
+class SaveSubsTest(unittest.TestCase):
+    def setUp(self):
+        self.synthesizer = SpeechSynthesizer("key", "region")
+
+    def tearDown(self):
+        self.synthesizer.close()
+
+    def save(self, groups):
+        with tempfile.TemporaryDirectory() as output_directory:
+            srt_filepath = os.path.join(output_directory, "transcript.srt")
+            self.synthesizer.save_subs(groups, srt_filepath)
+            self.assertEqual(os.listdir(output_directory), ["transcript.srt"])
+            with open(srt_filepath, encoding="utf-8") as f:
+                return f.read()
+
+    def test_writes_srt_blocks(self):
+        groups = [
+            {"text": "他说：", "start": 0, "end": 500},
+            {"text": "你好。", "start": 500, "end": 3723004},
+        ]
+        self.assertEqual(self.save(groups), (
+            "1\n00:00:00,000 --> 00:00:00,500\n他说：\n\n"
+            "2\n00:00:00,500 --> 01:02:03,004\n你好。\n\n"
+        ))
+
+    def test_skips_empty_and_zero_length_subtitles(self):
+        groups = [
+            {"text": "他说：", "start": 0, "end": 500},
+            {"text": "你好。", "start": 500, "end": 1200},
+            {"text": "\"", "start": 1200, "end": 1200},
+            {"text": "  ", "start": 1200, "end": 1500},
+            {"text": "下一句。", "start": 1500, "end": 2000},
+        ]
+        self.assertEqual(self.save(groups), (
+            "1\n00:00:00,000 --> 00:00:00,500\n他说：\n\n"
+            "2\n00:00:00,500 --> 00:00:01,200\n你好。\n\n"
+            "3\n00:00:01,500 --> 00:00:02,000\n下一句。\n\n"
+        ))
+
+    def test_collapses_blank_lines_in_text(self):
+        groups = [{"text": "\na\nb\n\n\nc\n", "start": 0, "end": 1000}]
+        self.assertEqual(self.save(groups), "1\n00:00:00,000 --> 00:00:01,000\na\nb\nc\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()